@@ -2,7 +2,7 @@
 
 import time
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List
 
 from google.adk.tools import ToolContext
 
@@ -43,6 +43,17 @@ def validate_required_state(
     }
 
 
+def ensure_state_container(
+    state: Any, key: str, default_factory: Callable[[], Any] = list
+) -> Any:
+    """Return the container stored under key, creating it on first use"""
+    container = state.get(key)
+    if container is None:
+        container = default_factory()
+        state[key] = container
+    return container
+
+
 def upload_file(
     file_path: str, tool_context: ToolContext, file_type: str = "auto"
 ) -> Dict[str, Any]:
@@ -221,19 +232,4 @@ def validate_agent_setup(agent_name: str, tools: List) -> Dict[str, Any]:
     """Validate agent has required tools and setup"""
     from config.agent_configs.responsibilities import AgentRegistry
 
-    if agent_name not in AgentRegistry.AGENT_RESPONSIBILITIES:
-        return {"valid": False, "error": f"Unknown agent: {agent_name}"}
-
-    config = AgentRegistry.AGENT_RESPONSIBILITIES[agent_name]
-    required_tools = config.get("tools_required", [])
-
-    # Check if tools match requirements (simplified check)
-    provided_tool_names = [getattr(tool, "name", str(tool)) for tool in tools]
-
-    return {
-        "valid": True,
-        "agent_config": config,
-        "required_tools": required_tools,
-        "provided_tools": provided_tool_names,
-        "phase": config["phase"].value,
-    }
+    return AgentRegistry.validate_agent_setup(agent_name, tools)
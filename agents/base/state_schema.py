@@ -28,6 +28,15 @@ class WorkflowPhase(str, Enum):
     DELIVERY = "delivery"
 
 
+# Phase lookup by stored value, skipping Enum.__call__ on every coercion
+_PHASE_BY_VALUE = {phase.value: phase for phase in WorkflowPhase}
+
+
+def coerce_phase(value: str) -> WorkflowPhase:
+    """Resolve a stored phase value, raising ValueError for unknown phases"""
+    return _PHASE_BY_VALUE.get(value) or WorkflowPhase(value)
+
+
 class StateKeys:
     """State key constants for consistent access"""
 
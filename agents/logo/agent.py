@@ -131,10 +131,11 @@ def generate_logos_multimodel(tool_context: ToolContext) -> Dict[str, Any]:
     }
 
     # Generate multiple logo concepts
-    generated_logos = {
+    generated_logos: Dict[str, Any] = {
         "concepts": [],
         "variations": [],
         "quality_scores": [],
+        "quality_max": 0.0,  # Running max of quality_scores for quality gates
         "generation_metadata": {
             "prompt_used": logo_prompt,
             "pillar_elements": pillar_elements,
@@ -160,6 +161,9 @@ def generate_logos_multimodel(tool_context: ToolContext) -> Dict[str, Any]:
                 generated_logos["variations"].append(logo_result)
 
             generated_logos["quality_scores"].append(logo_result["quality_score"])
+            generated_logos["quality_max"] = max(
+                generated_logos["quality_max"], logo_result["quality_score"]
+            )
             generated_logos["generation_metadata"]["models_used"].append(
                 logo_result["model_used"]
             )
@@ -1,7 +1,8 @@
 """Enhanced Research Agent with real web search integration (ADK v1.0.0)"""
 
 import time
-from typing import Any, Dict
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 
 from google.adk.agents import Agent, LlmAgent
 from google.adk.tools import ToolContext, agent_tool, google_search
@@ -16,6 +17,38 @@ search_agent = Agent(
     tools=[google_search],  # Only built-in tool allowed per agent
 )
 
+# Wrap search agent once at import so rebuilding root_agent reuses the same tool
+_SEARCH_TOOL = agent_tool.AgentTool(agent=search_agent)
+
+
+_COMPETITOR_WORDS = ("top", "best", "leading", "companies")
+_INSIGHT_WORDS = ("trend", "market", "growth", "industry")
+
+
+def _classify_search_results(
+    results: Iterable[Dict[str, Any]],
+) -> Iterator[Tuple[str, Any]]:
+    """Yield ("competitor", dict) / ("insight", str) records in a single pass"""
+    for result in results:
+        title = result.get("title", "")
+        snippet = result.get("snippet", "")
+        title_l = title.lower()
+        snippet_l = snippet.lower()
+
+        # Extract potential competitor names (simple heuristics)
+        if any(word in title_l for word in _COMPETITOR_WORDS):
+            yield "competitor", {
+                "name": title.split(" ")[0] if title else "Unknown",
+                "source": result.get("url", ""),
+                "description": (
+                    snippet[:100] + "..." if len(snippet) > 100 else snippet
+                ),
+            }
+
+        # Extract market insights
+        if any(word in snippet_l for word in _INSIGHT_WORDS):
+            yield "insight", snippet
+
 
 # Enhanced Research Functions using search agent
 def analyze_competitors_with_search(
@@ -41,37 +74,15 @@ def analyze_competitors_with_search(
     # Process results from search agent (stored in state by search agent)
     search_results = tool_context.state.get("search_results", {})
 
-    # Process search results to extract competitor data
-    competitors = []
-    market_insights = []
-
-    # Extract competitor names and insights from search results
+    # Process search results to extract competitor data and market insights
+    extracted: Dict[str, List[Any]] = {"competitor": [], "insight": []}
     if search_results and "search_results" in search_results:
-        for result in search_results["search_results"][:5]:  # Top 5 results
-            title = result.get("title", "")
-            snippet = result.get("snippet", "")
-
-            # Extract potential competitor names (simple heuristics)
-            if any(
-                word in title.lower()
-                for word in ["top", "best", "leading", "companies"]
-            ):
-                competitors.append(
-                    {
-                        "name": title.split(" ")[0] if title else "Unknown",
-                        "source": result.get("url", ""),
-                        "description": (
-                            snippet[:100] + "..." if len(snippet) > 100 else snippet
-                        ),
-                    }
-                )
-
-            # Extract market insights
-            if any(
-                word in snippet.lower()
-                for word in ["trend", "market", "growth", "industry"]
-            ):
-                market_insights.append(snippet)
+        for tag, payload in _classify_search_results(
+            islice(search_results["search_results"], 5)  # Top 5 results
+        ):
+            extracted[tag].append(payload)
+    competitors = extracted["competitor"]
+    market_insights = extracted["insight"]
 
     # Industry-specific competitor database (enhanced with search data)
     known_competitors = {
@@ -139,7 +150,7 @@ def analyze_competitors_with_search(
             "Potential for authentic storytelling",
         ],
         "research_metadata": {
-            "search_timestamp": time.time(),
+            "search_timestamp_ns": time.time_ns(),
             "sources_analyzed": (
                 len(search_results.get("search_results", [])) if search_results else 0
             ),
@@ -267,7 +278,7 @@ def analyze_market_trends_with_search(
             "Build trust through transparency",
         ],
         "research_insights": search_insights,
-        "analysis_timestamp": time.time(),
+        "analysis_timestamp_ns": time.time_ns(),
     }
 
     # Store in state
@@ -366,7 +377,7 @@ def generate_strategic_swot_analysis(tool_context: ToolContext) -> Dict[str, Any
             "market_trend_data": bool(market_trends),
             "web_search_enhanced": True,
         },
-        "analysis_timestamp": time.time(),
+        "analysis_timestamp_ns": time.time_ns(),
     }
 
     # Store in state
@@ -532,7 +543,7 @@ Always base analysis on discovery data and enhance with real-time web research."
     output_key="market_research",  # ADK v1.0.0 automatic state persistence
     # Use search agent as tool + custom functions (ADK v1.0.0 pattern)
     tools=[
-        agent_tool.AgentTool(agent=search_agent),  # Dedicated search agent as tool
+        _SEARCH_TOOL,  # Dedicated search agent as tool
         analyze_competitors_with_search,  # Custom research functions
         analyze_market_trends_with_search,
         generate_strategic_swot_analysis,
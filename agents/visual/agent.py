@@ -1,10 +1,127 @@
 """Visual Direction Agent with ADK v1.0.0 function tools"""
 
 import time
-from typing import Any, Dict
+from time import monotonic_ns
+from typing import Any, Dict, Tuple
 
 from google.adk.agents import LlmAgent
-from google.adk.tools import ToolContext
+from google.adk.tools import FunctionTool, ToolContext
+
+# Wall clock for the compiled deliverable; components only need ordering and
+# share one monotonic_ns() stamp per visual direction cycle
+_now = time.time
+_CYCLE_TS_KEY = "_cycle_ts"
+
+# Industry-specific imagery
+_INDUSTRY_IMAGERY: Dict[str, Tuple[str, ...]] = {
+    "technology": ("circuits", "innovation", "connectivity", "future"),
+    "healthcare": ("care", "trust", "healing", "protection"),
+    "food": ("freshness", "quality", "satisfaction", "tradition"),
+    "retail": ("experience", "value", "lifestyle", "aspiration"),
+}
+_DEFAULT_IMAGERY = ("quality", "innovation", "trust", "growth")
+
+# Aesthetic direction per style preference (applied in this order)
+_STYLE_AESTHETICS: Dict[str, Tuple[str, ...]] = {
+    "minimalist": ("clean lines", "white space", "simple forms"),
+    "professional": ("structured layouts", "corporate colors", "readable typography"),
+    "creative": ("unique shapes", "artistic elements", "expressive colors"),
+}
+
+# Color psychology mapping
+_COLOR_PSYCHOLOGY: Dict[str, Dict[str, str]] = {
+    "trust": {
+        "primary": "#2B4C8C",
+        "name": "deep blue",
+        "meaning": "reliability and professionalism",
+    },
+    "innovation": {
+        "primary": "#6C5CE7",
+        "name": "vibrant purple",
+        "meaning": "creativity and forward-thinking",
+    },
+    "growth": {
+        "primary": "#00B894",
+        "name": "fresh green",
+        "meaning": "progress and vitality",
+    },
+    "energy": {
+        "primary": "#E17055",
+        "name": "warm orange",
+        "meaning": "enthusiasm and dynamism",
+    },
+    "luxury": {
+        "primary": "#2D3436",
+        "name": "sophisticated black",
+        "meaning": "elegance and exclusivity",
+    },
+    "friendly": {
+        "primary": "#FDCB6E",
+        "name": "warm yellow",
+        "meaning": "approachability and optimism",
+    },
+}
+
+# Emotional tone -> color psychology key, including the tones emitted by
+# create_mood_board, so palette selection is a single lookup per tone
+_EMOTION_KEY_MAP: Dict[str, str] = {
+    variant: key
+    for key in _COLOR_PSYCHOLOGY
+    for variant in (key, key.replace("_", " "), key.replace("_", "-"))
+}
+_EMOTION_KEY_MAP.update(
+    {
+        "reliable and stable": "trust",
+        "forward-thinking and dynamic": "innovation",
+        "forward thinking": "innovation",
+        "reliable": "trust",
+        "dynamic": "energy",
+        "approachable": "friendly",
+    }
+)
+
+# Typography categories
+_TYPOGRAPHY_STYLES: Dict[str, Dict[str, str]] = {
+    "modern": {
+        "primary": "Sans-serif families like Helvetica, Montserrat, or Poppins",
+        "characteristics": "Clean, contemporary, highly legible",
+        "mood": "Progressive and approachable",
+    },
+    "professional": {
+        "primary": "Classic serif fonts like Times, Playfair, or Merriweather",
+        "characteristics": "Traditional, authoritative, trustworthy",
+        "mood": "Established and reliable",
+    },
+    "creative": {
+        "primary": "Display fonts with character like Oswald, Bebas, or custom lettering",
+        "characteristics": "Unique, expressive, memorable",
+        "mood": "Innovative and distinctive",
+    },
+    "friendly": {
+        "primary": "Rounded sans-serif like Nunito, Quicksand, or Open Sans",
+        "characteristics": "Approachable, warm, inviting",
+        "mood": "Accessible and human",
+    },
+}
+
+
+def _dig(data: Any, *keys: str, default: Any = None) -> Any:
+    """Walk nested mappings by key, returning default on any missing level"""
+    for key in keys:
+        getter = getattr(data, "get", None)
+        data = getter(key) if getter is not None else None
+        if data is None:
+            return default
+    return data
+
+
+def _cycle_ts(state: Any) -> int:
+    """Clock stamp shared by all component tools until the cycle is compiled"""
+    ts = state.get(_CYCLE_TS_KEY)
+    if ts is None:
+        ts = monotonic_ns()
+        state[_CYCLE_TS_KEY] = ts
+    return int(ts)
 
 
 # Visual Direction Agent Functions
@@ -12,11 +129,12 @@ def create_mood_board(tool_context: ToolContext) -> Dict[str, Any]:
     """Generate mood board concepts based on strategy and preferences"""
 
     # Get data from previous agents
-    client_brief = tool_context.state.get("client_brief", {})
-    market_research = tool_context.state.get("market_research", {})
+    state = tool_context.state
+    client_brief = state.get("client_brief", {})
+    market_research = state.get("market_research", {})
 
     style_preferences = client_brief.get("style_preferences", [])
-    industry = client_brief.get("company_info", {}).get("industry", "general")
+    industry = _dig(client_brief, "company_info", "industry", default="general")
 
     # Mood board elements based on inputs
     mood_elements = {
@@ -26,31 +144,15 @@ def create_mood_board(tool_context: ToolContext) -> Dict[str, Any]:
         "emotional_tone": [],
     }
 
-    # Industry-specific imagery
-    industry_imagery = {
-        "technology": ["circuits", "innovation", "connectivity", "future"],
-        "healthcare": ["care", "trust", "healing", "protection"],
-        "food": ["freshness", "quality", "satisfaction", "tradition"],
-        "retail": ["experience", "value", "lifestyle", "aspiration"],
-    }
-
-    mood_elements["imagery_themes"] = industry_imagery.get(
-        industry.lower(), ["quality", "innovation", "trust", "growth"]
+    mood_elements["imagery_themes"] = list(
+        _INDUSTRY_IMAGERY.get(industry.lower(), _DEFAULT_IMAGERY)
     )
 
     # Style-based visual direction
-    if "minimalist" in style_preferences:
-        mood_elements["aesthetic_direction"].extend(
-            ["clean lines", "white space", "simple forms"]
-        )
-    if "professional" in style_preferences:
-        mood_elements["aesthetic_direction"].extend(
-            ["structured layouts", "corporate colors", "readable typography"]
-        )
-    if "creative" in style_preferences:
-        mood_elements["aesthetic_direction"].extend(
-            ["unique shapes", "artistic elements", "expressive colors"]
-        )
+    prefs = frozenset(style_preferences)
+    for style, aesthetics in _STYLE_AESTHETICS.items():
+        if style in prefs:
+            mood_elements["aesthetic_direction"] += aesthetics
 
     # Emotional tone from strategy
     positioning = market_research.get("differentiation_strategy", "")
@@ -59,16 +161,24 @@ def create_mood_board(tool_context: ToolContext) -> Dict[str, Any]:
     if "innovative" in positioning.lower():
         mood_elements["emotional_tone"].append("forward-thinking and dynamic")
 
+    emotional_tone = mood_elements["emotional_tone"]
     mood_board = {
         "mood_board_concept": mood_elements,
         "visual_keywords": mood_elements["imagery_themes"]
         + mood_elements["aesthetic_direction"],
-        "mood_description": f"A {', '.join(style_preferences)} aesthetic that conveys {', '.join(mood_elements['emotional_tone'])}",
-        "creation_timestamp": time.time(),
+        "mood_description": "".join(
+            (
+                "A ",
+                ", ".join(style_preferences) if style_preferences else "brand",
+                " aesthetic that conveys ",
+                ", ".join(emotional_tone) if emotional_tone else "professionalism",
+            )
+        ),
+        "creation_timestamp_ns": _cycle_ts(state),
     }
 
     # Store in state
-    tool_context.state["mood_board"] = mood_board
+    state["mood_board"] = mood_board
 
     return mood_board
 
@@ -76,63 +186,22 @@ def create_mood_board(tool_context: ToolContext) -> Dict[str, Any]:
 def generate_color_palette(tool_context: ToolContext) -> Dict[str, Any]:
     """Generate color palettes with psychological mapping"""
 
-    # Get mood board and research data
-    mood_board = tool_context.state.get("mood_board", {})
-    market_research = tool_context.state.get("market_research", {})
-
-    emotional_tones = mood_board.get("mood_board_concept", {}).get(
-        "emotional_tone", ["professional"]
-    )
-    industry = (
-        tool_context.state.get("client_brief", {})
-        .get("company_info", {})
-        .get("industry", "general")
+    # Get mood board data
+    state = tool_context.state
+    emotional_tones = _dig(
+        state,
+        "mood_board",
+        "mood_board_concept",
+        "emotional_tone",
+        default=["professional"],
     )
 
-    # Color psychology mapping
-    color_psychology = {
-        "trust": {
-            "primary": "#2B4C8C",
-            "name": "deep blue",
-            "meaning": "reliability and professionalism",
-        },
-        "innovation": {
-            "primary": "#6C5CE7",
-            "name": "vibrant purple",
-            "meaning": "creativity and forward-thinking",
-        },
-        "growth": {
-            "primary": "#00B894",
-            "name": "fresh green",
-            "meaning": "progress and vitality",
-        },
-        "energy": {
-            "primary": "#E17055",
-            "name": "warm orange",
-            "meaning": "enthusiasm and dynamism",
-        },
-        "luxury": {
-            "primary": "#2D3436",
-            "name": "sophisticated black",
-            "meaning": "elegance and exclusivity",
-        },
-        "friendly": {
-            "primary": "#FDCB6E",
-            "name": "warm yellow",
-            "meaning": "approachability and optimism",
-        },
-    }
-
     # Select primary color based on dominant emotion or default to trust
-    primary_emotion = emotional_tones[0] if emotional_tones else "trust"
-    primary_color_key = "trust"  # Default
-
-    for emotion in emotional_tones:
-        if emotion.replace(" ", "_").replace("-", "_") in color_psychology:
-            primary_color_key = emotion.replace(" ", "_").replace("-", "_")
-            break
-
-    primary_color = color_psychology.get(primary_color_key, color_psychology["trust"])
+    primary_color_key = next(
+        (_EMOTION_KEY_MAP[t] for t in emotional_tones if t in _EMOTION_KEY_MAP),
+        "trust",
+    )
+    primary_color = _COLOR_PSYCHOLOGY[primary_color_key]
 
     # Generate complementary colors
     color_palette = {
@@ -149,11 +218,11 @@ def generate_color_palette(tool_context: ToolContext) -> Dict[str, Any]:
             "accent": "Call-to-action buttons, highlights",
         },
         "color_strategy": f"Primary color conveys {primary_color['meaning']}",
-        "creation_timestamp": time.time(),
+        "creation_timestamp_ns": _cycle_ts(state),
     }
 
     # Store in state
-    tool_context.state["color_palette"] = color_palette
+    state["color_palette"] = color_palette
 
     return color_palette
 
@@ -162,46 +231,18 @@ def recommend_typography(tool_context: ToolContext) -> Dict[str, Any]:
     """Generate typography recommendations and pairings"""
 
     # Get brand personality and style data
-    client_brief = tool_context.state.get("client_brief", {})
-    style_preferences = client_brief.get("style_preferences", [])
-    industry = client_brief.get("company_info", {}).get("industry", "general")
-
-    # Typography categories
-    typography_styles = {
-        "modern": {
-            "primary": "Sans-serif families like Helvetica, Montserrat, or Poppins",
-            "characteristics": "Clean, contemporary, highly legible",
-            "mood": "Progressive and approachable",
-        },
-        "professional": {
-            "primary": "Classic serif fonts like Times, Playfair, or Merriweather",
-            "characteristics": "Traditional, authoritative, trustworthy",
-            "mood": "Established and reliable",
-        },
-        "creative": {
-            "primary": "Display fonts with character like Oswald, Bebas, or custom lettering",
-            "characteristics": "Unique, expressive, memorable",
-            "mood": "Innovative and distinctive",
-        },
-        "friendly": {
-            "primary": "Rounded sans-serif like Nunito, Quicksand, or Open Sans",
-            "characteristics": "Approachable, warm, inviting",
-            "mood": "Accessible and human",
-        },
-    }
-
-    # Select based on brand personality
-    primary_style = None
-    for personality in style_preferences:
-        if personality.lower() in typography_styles:
-            primary_style = typography_styles[personality.lower()]
-            break
+    state = tool_context.state
+    style_preferences = _dig(state, "client_brief", "style_preferences", default=[])
 
-    if not primary_style:
-        primary_style = typography_styles["modern"]  # Default
+    # Select based on first matching brand personality, defaulting to modern
+    style_key = next(
+        (p for p in map(str.lower, style_preferences) if p in _TYPOGRAPHY_STYLES),
+        "modern",
+    )
+    primary_style = _TYPOGRAPHY_STYLES[style_key]
 
     typography_recommendations = {
-        "primary_typography": primary_style,
+        "primary_typography": dict(primary_style),
         "hierarchy_system": {
             "heading_1": "Primary font, bold, large scale",
             "heading_2": "Primary font, semi-bold, medium scale",
@@ -216,11 +257,11 @@ def recommend_typography(tool_context: ToolContext) -> Dict[str, Any]:
             "Special character support",
             "Mobile optimization",
         ],
-        "creation_timestamp": time.time(),
+        "creation_timestamp_ns": _cycle_ts(state),
     }
 
     # Store in state
-    tool_context.state["typography_recommendations"] = typography_recommendations
+    state["typography_recommendations"] = typography_recommendations
 
     return typography_recommendations
 
@@ -229,9 +270,10 @@ def compile_visual_direction(tool_context: ToolContext) -> Dict[str, Any]:
     """Compile comprehensive visual direction for logo development"""
 
     # Gather all visual direction data
-    mood_board = tool_context.state.get("mood_board", {})
-    color_palette = tool_context.state.get("color_palette", {})
-    typography = tool_context.state.get("typography_recommendations", {})
+    state = tool_context.state
+    mood_board = state.get("mood_board", {})
+    color_palette = state.get("color_palette", {})
+    typography = state.get("typography_recommendations", {})
 
     # Compile comprehensive visual direction
     visual_direction = {
@@ -248,21 +290,32 @@ def compile_visual_direction(tool_context: ToolContext) -> Dict[str, Any]:
             "logo_direction": typography.get("logo_typography_direction", ""),
             "overall_aesthetic": "Modern, professional brand identity",
         },
-        "compilation_timestamp": time.time(),
+        "compilation_timestamp": _now(),
     }
 
     # Store as output_key for next agent
-    tool_context.state["visual_direction"] = visual_direction
+    state["visual_direction"] = visual_direction
+    state[_CYCLE_TS_KEY] = None  # Next tool call starts a new cycle
 
     return {
         "visual_direction_compiled": True,
         "visual_direction": visual_direction,
-        "colors_selected": len(color_palette.get("primary_colors", [])),
+        "colors_selected": len(color_palette.get("primary_colors", ())),
         "typography_defined": bool(typography.get("primary_typography")),
-        "mood_elements": len(mood_board.get("visual_keywords", [])),
+        "mood_elements": len(mood_board.get("visual_keywords", ())),
     }
 
 
+# Wrap tool functions once at import; LlmAgent would otherwise re-wrap plain
+# callables in FunctionTool each time it resolves its tools
+_VISUAL_TOOLS = [
+    FunctionTool(func=create_mood_board),
+    FunctionTool(func=generate_color_palette),
+    FunctionTool(func=recommend_typography),
+    FunctionTool(func=compile_visual_direction),
+]
+
+
 # Visual Direction Agent Implementation
 root_agent = LlmAgent(
     name="visual_direction_agent",
@@ -281,10 +334,5 @@ IMPORTANT: Your output will directly inform the Logo Generation Agent. Be specif
 Communication style: Creative but strategic, like a creative director presenting visual concepts with strategic rationale.""",
     description="Visual direction agent for creative strategy and mood boards",
     output_key="visual_direction",  # ADK v1.0.0 automatic state persistence
-    tools=[
-        create_mood_board,
-        generate_color_palette,
-        recommend_typography,
-        compile_visual_direction,
-    ],
+    tools=_VISUAL_TOOLS,
 )
@@ -1,9 +1,46 @@
 """Quality gate definitions for phase transitions"""
 
-from typing import Any, Callable, Dict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import numpy as np
 
 from agents.base.state_schema import StateKeys, WorkflowPhase
 
+# Below this many states, validate_phase_batch just loops validate_phase
+BATCH_MIN_STATES = 32
+
+
+class GateResult(NamedTuple):
+    """Outcome of a single quality gate"""
+
+    gate_name: str
+    score: float
+    passed: bool
+    threshold: float
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable form used in phase validation results"""
+        result = {
+            "gate_name": self.gate_name,
+            "score": self.score,
+            "passed": self.passed,
+            "threshold": self.threshold,
+        }
+        if self.error is not None:
+            result["error"] = self.error
+        return result
+
 
 class QualityGate:
     """Individual quality gate definition"""
@@ -13,24 +50,46 @@ class QualityGate:
         self.validator = validator
         self.threshold = threshold
 
-    def validate(self, state: Dict[str, Any]) -> Dict[str, Any]:
+    def validate(self, state: Dict[str, Any]) -> GateResult:
         """Run validation and return result"""
         try:
             score = self.validator(state)
-            return {
-                "gate_name": self.name,
-                "score": score,
-                "passed": score >= self.threshold,
-                "threshold": self.threshold,
-            }
+            return GateResult(self.name, score, score >= self.threshold, self.threshold)
         except Exception as e:
-            return {
-                "gate_name": self.name,
-                "score": 0.0,
-                "passed": False,
-                "error": str(e),
-                "threshold": self.threshold,
-            }
+            return GateResult(self.name, 0.0, False, self.threshold, str(e))
+
+
+def _phase_result(phase_value: str, results: Sequence[GateResult]) -> Dict[str, Any]:
+    """Aggregate gate results into a serializable phase validation result"""
+    passed_gates = sum(result.passed for result in results)
+    return {
+        "phase": phase_value,
+        "gates": [result.to_dict() for result in results],
+        "overall_passed": passed_gates == len(results),
+        "total_gates": len(results),
+        "passed_gates": passed_gates,
+    }
+
+
+def _compile_phase_gates(
+    phase: WorkflowPhase, gates: Tuple[QualityGate, ...]
+) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Bind a phase's gates into one validator that runs them in a single pass"""
+    compiled = tuple((gate.name, gate.validator, gate.threshold) for gate in gates)
+    phase_value = phase.value
+
+    def validate(state: Dict[str, Any]) -> Dict[str, Any]:
+        results = []
+        for name, validator, threshold in compiled:
+            try:
+                score = validator(state)
+                results.append(GateResult(name, score, score >= threshold, threshold))
+            except Exception as e:
+                results.append(GateResult(name, 0.0, False, threshold, str(e)))
+
+        return _phase_result(phase_value, results)
+
+    return validate
 
 
 class QualityGateConfig:
@@ -43,9 +102,12 @@ class QualityGateConfig:
         if not brief:
             return 0.0
 
-        required_fields = ["company_info", "target_audience", "style_preferences"]
-        completed = sum(1 for field in required_fields if brief.get(field))
-        return completed / len(required_fields)
+        get = brief.get
+        return (
+            bool(get("company_info"))
+            + bool(get("target_audience"))
+            + bool(get("style_preferences"))
+        ) / 3
 
     @staticmethod
     def validate_research_depth(state: Dict[str, Any]) -> float:
@@ -54,9 +116,12 @@ class QualityGateConfig:
         if not research:
             return 0.0
 
-        required_sections = ["competitors", "industry_trends", "swot_analysis"]
-        completed = sum(1 for section in required_sections if research.get(section))
-        return completed / len(required_sections)
+        get = research.get
+        return (
+            bool(get("competitors"))
+            + bool(get("industry_trends"))
+            + bool(get("swot_analysis"))
+        ) / 3
 
     @staticmethod
     def validate_visual_coherence(state: Dict[str, Any]) -> float:
@@ -66,11 +131,12 @@ class QualityGateConfig:
             return 0.0
 
         # Check if color palette and mood board align
-        has_colors = bool(visual.get("color_palette"))
-        has_mood = bool(visual.get("mood_board_concept"))
-        has_typography = bool(visual.get("typography_direction"))
-
-        return (has_colors + has_mood + has_typography) / 3
+        get = visual.get
+        return (
+            bool(get("color_palette"))
+            + bool(get("mood_board_concept"))
+            + bool(get("typography_direction"))
+        ) / 3
 
     @staticmethod
     def validate_logo_quality(state: Dict[str, Any]) -> float:
@@ -79,53 +145,90 @@ class QualityGateConfig:
         if not logos:
             return 0.0
 
+        # Best logo quality, maintained incrementally by the logo agent
+        quality_max = logos.get("quality_max")
+        if quality_max:
+            return float(quality_max)
+
         quality_scores = logos.get("quality_scores", [])
         if not quality_scores:
             return 0.0
 
-        return max(quality_scores)  # Best logo quality
+        return max(quality_scores)
 
-    # Quality gates for each phase
+    # Quality gates for each phase; tuples so register_gate is the only way in
     PHASE_GATES = {
-        WorkflowPhase.DISCOVERY: [
+        WorkflowPhase.DISCOVERY: (
             QualityGate("brief_completeness", validate_client_brief_completeness, 0.8),
-        ],
-        WorkflowPhase.RESEARCH: [
+        ),
+        WorkflowPhase.RESEARCH: (
             QualityGate("research_depth", validate_research_depth, 0.7),
-        ],
-        WorkflowPhase.VISUAL: [
+        ),
+        WorkflowPhase.VISUAL: (
             QualityGate("visual_coherence", validate_visual_coherence, 0.8),
-        ],
-        WorkflowPhase.LOGO: [
-            QualityGate("logo_quality", validate_logo_quality, 0.7),
-        ],
-        WorkflowPhase.BRAND: [
-            # Brand system gates would go here
-        ],
-        WorkflowPhase.ASSETS: [
-            # Asset generation gates would go here
-        ],
+        ),
+        WorkflowPhase.LOGO: (QualityGate("logo_quality", validate_logo_quality, 0.7),),
+        WorkflowPhase.BRAND: (),  # Brand system gates would go here
+        WorkflowPhase.ASSETS: (),  # Asset generation gates would go here
     }
 
+    # Gates and compiled validators keyed by phase value, so callers passing
+    # either a WorkflowPhase or its string value resolve in one probe
+    _GATES: Dict[str, Tuple[QualityGate, ...]] = {
+        phase.value: gates for phase, gates in PHASE_GATES.items()
+    }
+    _COMPILED = {
+        phase.value: _compile_phase_gates(phase, gates)
+        for phase, gates in PHASE_GATES.items()
+    }
+
+    @classmethod
+    def register_gate(cls, phase: WorkflowPhase, gate: QualityGate) -> None:
+        """Add a quality gate to a phase and recompile its validator"""
+        gates = cls.PHASE_GATES.get(phase, ()) + (gate,)
+        cls.PHASE_GATES[phase] = gates
+        cls._GATES[phase.value] = gates
+        cls._COMPILED[phase.value] = _compile_phase_gates(phase, gates)
+
     @classmethod
     def validate_phase(
-        cls, phase: WorkflowPhase, state: Dict[str, Any]
+        cls, phase: Union[WorkflowPhase, str], state: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Run all quality gates for a phase"""
-        gates = cls.PHASE_GATES.get(phase, [])
-        results = []
-        overall_passed = True
-
-        for gate in gates:
-            result = gate.validate(state)
-            results.append(result)
-            if not result["passed"]:
-                overall_passed = False
-
-        return {
-            "phase": phase.value,
-            "gates": results,
-            "overall_passed": overall_passed,
-            "total_gates": len(gates),
-            "passed_gates": sum(1 for r in results if r["passed"]),
-        }
+        key = phase.value if isinstance(phase, WorkflowPhase) else phase
+        compiled = cls._COMPILED.get(key)
+        if compiled is not None:
+            return compiled(state)
+
+        # Phases without a compiled validator have no gates
+        return _phase_result(key, [])
+
+    @classmethod
+    def validate_phase_batch(
+        cls, phase: Union[WorkflowPhase, str], states: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Run quality gates for a phase over many states (e.g. history replay)"""
+        if len(states) <= BATCH_MIN_STATES:
+            return [cls.validate_phase(phase, state) for state in states]
+
+        key = phase.value if isinstance(phase, WorkflowPhase) else phase
+        gates = cls._GATES.get(key, ())
+
+        # Score each gate exactly as validate_phase does, then count passes for
+        # every state in one vector op
+        rows = [[gate.validate(state) for gate in gates] for state in states]
+        passed = np.array(
+            [[result.passed for result in row] for row in rows], dtype=np.bool_
+        ).reshape(len(states), len(gates))
+        passed_counts = passed.sum(axis=1)
+
+        return [
+            {
+                "phase": key,
+                "gates": [result.to_dict() for result in row],
+                "overall_passed": bool(count == len(gates)),
+                "total_gates": len(gates),
+                "passed_gates": int(count),
+            }
+            for row, count in zip(rows, passed_counts)
+        ]
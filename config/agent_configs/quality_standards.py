@@ -1,9 +1,14 @@
 """Quality standards and thresholds configuration"""
 
-from typing import Any, Dict
+import operator
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Union
 
 from agents.base.state_schema import WorkflowPhase
 
+# Shared read-only result for phases without requirements
+_NO_STANDARDS: Mapping[str, Any] = MappingProxyType({})
+
 
 class QualityStandards:
     """Central quality standards configuration"""
@@ -16,8 +21,8 @@ class QualityStandards:
         "client_satisfaction_minimum": 0.8,
     }
 
-    # Phase-specific requirements
-    PHASE_REQUIREMENTS = {
+    # Phase-specific requirements; str-mixin phases also match their raw values
+    PHASE_REQUIREMENTS: Dict[str, Dict[str, Any]] = {
         WorkflowPhase.DISCOVERY: {
             "required_fields": ["company_info", "target_audience", "style_preferences"],
             "minimum_uploaded_files": 0,
@@ -64,30 +69,40 @@ class QualityStandards:
         "workflow_stuck_minutes": 30,
     }
 
+    # (metric, comparison, threshold, default) checked by should_escalate,
+    # ordered so the most common escalation cause short-circuits first
+    _ESCALATION_CHECKS = (
+        (
+            "critical_error_count",
+            operator.ge,
+            ESCALATION_TRIGGERS["critical_error_count"],
+            0,
+        ),
+        (
+            "consecutive_failures",
+            operator.ge,
+            ESCALATION_TRIGGERS["consecutive_quality_failures"],
+            0,
+        ),
+        ("overall_score", operator.lt, ESCALATION_TRIGGERS["overall_score_below"], 1.0),
+        (
+            "client_satisfaction",
+            operator.lt,
+            ESCALATION_TRIGGERS["client_satisfaction_below"],
+            1.0,
+        ),
+    )
+
     @classmethod
-    def get_phase_standards(cls, phase: WorkflowPhase) -> Dict[str, Any]:
+    def get_phase_standards(cls, phase: Union[WorkflowPhase, str]) -> Mapping[str, Any]:
         """Get quality standards for specific phase"""
-        return cls.PHASE_REQUIREMENTS.get(phase, {})
+        return cls.PHASE_REQUIREMENTS.get(phase, _NO_STANDARDS)
 
     @classmethod
     def should_escalate(cls, quality_metrics: Dict[str, Any]) -> bool:
         """Determine if quality issues should trigger escalation"""
-        triggers = cls.ESCALATION_TRIGGERS
-
-        # Check various escalation conditions
-        if (
-            quality_metrics.get("consecutive_failures", 0)
-            >= triggers["consecutive_quality_failures"]
-        ):
-            return True
-
-        if quality_metrics.get("overall_score", 1.0) < triggers["overall_score_below"]:
-            return True
-
-        if (
-            quality_metrics.get("client_satisfaction", 1.0)
-            < triggers["client_satisfaction_below"]
-        ):
-            return True
-
-        return False
+        get = quality_metrics.get
+        return any(
+            compare(get(metric, default), threshold)
+            for metric, compare, threshold, default in cls._ESCALATION_CHECKS
+        )
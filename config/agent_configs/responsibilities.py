@@ -131,6 +131,12 @@ class AgentRegistry:
         },
     }
 
+    # Required tool names per agent, precomputed for set comparisons
+    _REQUIRED_TOOLS = {
+        agent_name: frozenset(config.get("tools_required", []))
+        for agent_name, config in AGENT_RESPONSIBILITIES.items()
+    }
+
     @classmethod
     def get_agent_class(cls, phase: WorkflowPhase) -> Type[BrandingAgentBase]:
         """Get appropriate agent base class for phase"""
@@ -147,11 +153,15 @@ class AgentRegistry:
 
         # Check if tools match requirements (simplified check)
         provided_tool_names = [getattr(tool, "name", str(tool)) for tool in tools]
+        required = cls._REQUIRED_TOOLS[agent_name]
+        provided = frozenset(provided_tool_names)
 
         return {
             "valid": True,
             "agent_config": config,
             "required_tools": required_tools,
             "provided_tools": provided_tool_names,
+            "missing_tools": sorted(required - provided),
+            "extra_tools": sorted(provided - required),
             "phase": config["phase"].value,
         }
@@ -1,8 +1,8 @@
 """Session service configuration for ADK v1.2.1"""
 
 import os
+import secrets
 import time
-import uuid
 from typing import Any, Dict, Optional
 
 from google.adk.sessions import InMemorySessionService, Session
@@ -14,6 +14,37 @@ from agents.base.state_schema import (
     WorkflowPhase,
 )
 
+# Initial session state; per-session and mutable values are filled in by
+# BrandingSessionConfig.create_initial_state
+_STATE_TEMPLATE: Dict[str, Any] = {
+    StateKeys.PROJECT_STATUS: ProjectStatus.ACTIVE.value,
+    StateKeys.CURRENT_PHASE: WorkflowPhase.DISCOVERY.value,
+    StateKeys.CLIENT_ID: None,
+    StateKeys.PROJECT_ID: None,
+    "created_timestamp": None,
+    "project_name": None,
+    # Initialize empty phase data
+    StateKeys.CLIENT_BRIEF: None,
+    StateKeys.MARKET_RESEARCH: None,
+    StateKeys.VISUAL_DIRECTION: None,
+    StateKeys.GENERATED_LOGOS: None,
+    StateKeys.SELECTED_LOGO: None,
+    StateKeys.BRAND_SYSTEM: None,
+    StateKeys.FINAL_ASSETS: None,
+    # Initialize collections
+    StateKeys.UPLOADED_FILES: None,
+    "generated_files": None,
+    "temp_files": None,
+    # Initialize quality control
+    StateKeys.APPROVAL_CHECKPOINTS: None,
+    StateKeys.QUALITY_SCORES: None,
+    "revision_history": None,
+    # Initialize error handling
+    StateKeys.LAST_ERROR: None,
+    StateKeys.RETRY_COUNT: 0,
+    StateKeys.ESCALATION_TRIGGERED: False,
+}
+
 
 class BrandingSessionConfig:
     """Configuration for branding assistant sessions"""
@@ -37,33 +68,18 @@ class BrandingSessionConfig:
         cls, client_id: str, project_name: str = None
     ) -> Dict[str, Any]:
         """Create initial session state for new project"""
-        project_id = f"proj_{uuid.uuid4().hex[:8]}"
+        project_id = f"proj_{secrets.token_hex(4)}"
 
-        return {
-            StateKeys.PROJECT_STATUS: ProjectStatus.ACTIVE.value,
-            StateKeys.CURRENT_PHASE: WorkflowPhase.DISCOVERY.value,
-            StateKeys.CLIENT_ID: client_id,
-            StateKeys.PROJECT_ID: project_id,
-            "created_timestamp": time.time(),
-            "project_name": project_name or f"Project {project_id}",
-            # Initialize empty phase data
-            StateKeys.CLIENT_BRIEF: None,
-            StateKeys.MARKET_RESEARCH: None,
-            StateKeys.VISUAL_DIRECTION: None,
-            StateKeys.GENERATED_LOGOS: None,
-            StateKeys.SELECTED_LOGO: None,
-            StateKeys.BRAND_SYSTEM: None,
-            StateKeys.FINAL_ASSETS: None,
-            # Initialize collections
-            StateKeys.UPLOADED_FILES: [],
-            "generated_files": [],
-            "temp_files": [],
-            # Initialize quality control
-            StateKeys.APPROVAL_CHECKPOINTS: {},
-            StateKeys.QUALITY_SCORES: {},
-            "revision_history": [],
-            # Initialize error handling
-            StateKeys.LAST_ERROR: None,
-            StateKeys.RETRY_COUNT: 0,
-            StateKeys.ESCALATION_TRIGGERED: False,
-        }
+        state = _STATE_TEMPLATE.copy()
+        state[StateKeys.CLIENT_ID] = client_id
+        state[StateKeys.PROJECT_ID] = project_id
+        state["created_timestamp"] = time.time()
+        state["project_name"] = project_name or f"Project {project_id}"
+        # Fresh containers per session; the template only holds immutables
+        state[StateKeys.UPLOADED_FILES] = []
+        state["generated_files"] = []
+        state["temp_files"] = []
+        state[StateKeys.APPROVAL_CHECKPOINTS] = {}
+        state[StateKeys.QUALITY_SCORES] = {}
+        state["revision_history"] = []
+        return state
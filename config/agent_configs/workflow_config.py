@@ -1,6 +1,6 @@
 """Workflow orchestration configuration for sequential agent pipeline"""
 
-from typing import Dict, Optional
+from typing import Any, Dict, FrozenSet, List, Optional
 
 from agents.base.state_schema import StateKeys, WorkflowPhase
 
@@ -19,20 +19,32 @@ class WorkflowTransition:
         WorkflowPhase.DELIVERY,
     ]
 
+    # Next phase in sequence (None after the final phase)
+    NEXT_PHASE: Dict[WorkflowPhase, Optional[WorkflowPhase]] = dict(
+        zip(WORKFLOW_SEQUENCE, WORKFLOW_SEQUENCE[1:] + [None])
+    )
+
     # Valid transitions map
     VALID_TRANSITIONS = {
-        WorkflowPhase.DISCOVERY: [WorkflowPhase.RESEARCH],
-        WorkflowPhase.RESEARCH: [
+        WorkflowPhase.DISCOVERY: (WorkflowPhase.RESEARCH,),
+        WorkflowPhase.RESEARCH: (
             WorkflowPhase.VISUAL,
             WorkflowPhase.DISCOVERY,
-        ],  # Can go back
-        WorkflowPhase.VISUAL: [WorkflowPhase.LOGO, WorkflowPhase.RESEARCH],
-        WorkflowPhase.LOGO: [WorkflowPhase.BRAND, WorkflowPhase.VISUAL],
-        WorkflowPhase.BRAND: [WorkflowPhase.ASSETS, WorkflowPhase.LOGO],
-        WorkflowPhase.ASSETS: [WorkflowPhase.DELIVERY, WorkflowPhase.BRAND],
-        WorkflowPhase.DELIVERY: [],  # Final phase
+        ),  # Can go back
+        WorkflowPhase.VISUAL: (WorkflowPhase.LOGO, WorkflowPhase.RESEARCH),
+        WorkflowPhase.LOGO: (WorkflowPhase.BRAND, WorkflowPhase.VISUAL),
+        WorkflowPhase.BRAND: (WorkflowPhase.ASSETS, WorkflowPhase.LOGO),
+        WorkflowPhase.ASSETS: (WorkflowPhase.DELIVERY, WorkflowPhase.BRAND),
+        WorkflowPhase.DELIVERY: (),  # Final phase
     }
 
+    # Every valid (from, to) pair, for single-probe transition checks
+    _VALID_EDGES = frozenset(
+        (from_phase, to_phase)
+        for from_phase, targets in VALID_TRANSITIONS.items()
+        for to_phase in targets
+    )
+
     # Agent responsible for each phase
     PHASE_AGENTS = {
         WorkflowPhase.DISCOVERY: "discovery_agent",
@@ -47,18 +59,12 @@ class WorkflowTransition:
     @classmethod
     def can_transition(cls, from_phase: WorkflowPhase, to_phase: WorkflowPhase) -> bool:
         """Check if transition is valid"""
-        return to_phase in cls.VALID_TRANSITIONS.get(from_phase, [])
+        return (from_phase, to_phase) in cls._VALID_EDGES
 
     @classmethod
     def get_next_phase(cls, current_phase: WorkflowPhase) -> Optional[WorkflowPhase]:
         """Get next phase in sequence"""
-        try:
-            current_index = cls.WORKFLOW_SEQUENCE.index(current_phase)
-            if current_index < len(cls.WORKFLOW_SEQUENCE) - 1:
-                return cls.WORKFLOW_SEQUENCE[current_index + 1]
-        except ValueError:
-            pass
-        return None
+        return cls.NEXT_PHASE.get(current_phase)
 
     @classmethod
     def get_responsible_agent(cls, phase: WorkflowPhase) -> str:
@@ -70,37 +76,56 @@ class WorkflowTriggers:
     """Defines triggers for agent activation"""
 
     # State-based triggers for each agent
-    AGENT_TRIGGERS = {
+    AGENT_TRIGGERS: Dict[str, Dict[str, Any]] = {
         "discovery_agent": {
-            "required_state": [],  # Always can start
+            "required_state": (),  # Always can start
             "trigger_conditions": [],
         },
         "research_agent": {
-            "required_state": [StateKeys.CLIENT_BRIEF],
+            "required_state": (StateKeys.CLIENT_BRIEF,),
             "trigger_conditions": ["client_brief_complete"],
         },
         "visual_direction_agent": {
-            "required_state": [StateKeys.CLIENT_BRIEF, StateKeys.MARKET_RESEARCH],
+            "required_state": (StateKeys.CLIENT_BRIEF, StateKeys.MARKET_RESEARCH),
             "trigger_conditions": ["research_complete", "client_brief_complete"],
         },
         "logo_generation_agent": {
-            "required_state": [StateKeys.VISUAL_DIRECTION],
+            "required_state": (StateKeys.VISUAL_DIRECTION,),
             "trigger_conditions": ["visual_direction_approved"],
         },
         "brand_system_agent": {
-            "required_state": [StateKeys.SELECTED_LOGO],
+            "required_state": (StateKeys.SELECTED_LOGO,),
             "trigger_conditions": ["logo_selected"],
         },
         "asset_generation_agent": {
-            "required_state": [StateKeys.BRAND_SYSTEM],
+            "required_state": (StateKeys.BRAND_SYSTEM,),
             "trigger_conditions": ["brand_system_complete"],
         },
     }
 
+    # Required keys per agent, and every key any trigger depends on
+    required_keys_by_agent: Dict[str, FrozenSet[str]] = {
+        agent_name: frozenset(trigger_config["required_state"])
+        for agent_name, trigger_config in AGENT_TRIGGERS.items()
+    }
+    _TRIGGER_KEYS = frozenset().union(*required_keys_by_agent.values())
+
     @classmethod
     def can_trigger_agent(cls, agent_name: str, state: Dict) -> bool:
         """Check if agent can be triggered based on state"""
         trigger_config = cls.AGENT_TRIGGERS.get(agent_name, {})
-        required_state = trigger_config.get("required_state", [])
+        required_state = trigger_config.get("required_state", ())
+        if not required_state:
+            return True
+
+        return all(state.get(key) is not None for key in required_state)
 
-        return all(key in state and state[key] is not None for key in required_state)
+    @classmethod
+    def batch_triggerable(cls, state: Dict) -> List[str]:
+        """Agents whose triggers are satisfied, reading each trigger key once"""
+        present = {key for key in cls._TRIGGER_KEYS if state.get(key) is not None}
+        return [
+            agent_name
+            for agent_name, required in cls.required_keys_by_agent.items()
+            if required <= present
+        ]
@@ -2,18 +2,20 @@
 AI Branding Assistant - Main Application Entry Point
 """
 
-import argparse
+from __future__ import annotations
+
 import os
 import sys
 from pathlib import Path
-
-import aiohttp_cors
-import uvicorn
-from aiohttp import web, web_request
+from typing import TYPE_CHECKING
 
 # Load environment variables
 from dotenv import load_dotenv
 
+# Web server imports are deferred to the web path to keep CLI startup light
+if TYPE_CHECKING:
+    from aiohttp import web, web_request
+
 # Add project root to Python path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
@@ -23,6 +25,8 @@ load_dotenv()
 
 async def hello_handler(request: web_request.Request) -> web.Response:
     """Basic hello endpoint"""
+    from aiohttp import web
+
     return web.json_response(
         {
             "message": "🎨 ADK Branding Assistant API",
@@ -34,11 +38,16 @@ async def hello_handler(request: web_request.Request) -> web.Response:
 
 async def health_handler(request: web_request.Request) -> web.Response:
     """Health check endpoint"""
+    from aiohttp import web
+
     return web.json_response({"status": "healthy"})
 
 
 def create_app() -> web.Application:
     """Create and configure the web application"""
+    import aiohttp_cors
+    from aiohttp import web
+
     app = web.Application()
 
     # Configure CORS
@@ -54,13 +63,9 @@ def create_app() -> web.Application:
         },
     )
 
-    # Add routes
-    app.router.add_get("/", hello_handler)
-    app.router.add_get("/health", health_handler)
-
-    # Add CORS to all routes
-    for route in list(app.router.routes()):
-        cors.add(route)
+    # Add routes with CORS
+    cors.add(app.router.add_get("/", hello_handler))
+    cors.add(app.router.add_get("/health", health_handler))
 
     return app
 
@@ -80,12 +85,16 @@ def start_web_server(host: str = "0.0.0.0", port: int = 8000):
     print("✅ Environment checked")
     print(f"🚀 Starting server on http://{host}:{port}")
 
+    from aiohttp import web
+
     app = create_app()
     web.run_app(app, host=host, port=port)
 
 
 def cli():
     """Command line interface"""
+    import argparse
+
     parser = argparse.ArgumentParser(description="ADK Branding Assistant")
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
@@ -2,6 +2,7 @@
 Quality assurance and environment validation script
 """
 
+import mmap
 import subprocess
 import sys
 from pathlib import Path
@@ -12,26 +13,38 @@ def run_quality_checks():
 
     print("🔍 Running quality assurance checks...")
 
-    # Code formatting
-    print("📝 Checking code formatting...")
-    subprocess.run(["uv", "run", "black", "--check", "."], check=False)
-
-    # Import sorting
-    print("📋 Checking import organization...")
-    subprocess.run(["uv", "run", "isort", "--check-only", "."], check=False)
-
-    # Type checking
-    print("🔍 Running type checks...")
-    subprocess.run(["uv", "run", "mypy", "agents/", "tools/"], check=False)
+    # Formatting, import and type checks are independent, so run them together
+    checks = [
+        ("📝 Checking code formatting...", ["uv", "run", "black", "--check", "."]),
+        (
+            "📋 Checking import organization...",
+            ["uv", "run", "isort", "--check-only", "."],
+        ),
+        ("🔍 Running type checks...", ["uv", "run", "mypy", "agents/", "tools/"]),
+    ]
+    procs = [
+        subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+        )
+        for _, cmd in checks
+    ]
+
+    # Report in a stable order once each check finishes
+    for (label, _), proc in zip(checks, procs):
+        output, _ = proc.communicate()
+        print(label)
+        if output:
+            print(output, end="")
 
     # Security check (basic)
     print("🔒 Checking for common security issues...")
     env_file = Path(".env")
-    if env_file.exists():
-        with open(env_file) as f:
-            content = f.read()
-            if "your-" in content:
-                print("⚠️  Warning: .env file contains placeholder values")
+    if env_file.exists() and env_file.stat().st_size:
+        # Scan the raw bytes in place; empty files cannot be mapped
+        with open(env_file, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm.find(b"your-") != -1:
+                    print("⚠️  Warning: .env file contains placeholder values")
 
     print("✅ Quality checks complete!")
 
@@ -0,0 +1,33 @@
+"""Tests for quality gate validation"""
+
+import pytest
+
+from agents.base.state_schema import WorkflowPhase
+from config.agent_configs.quality_gates import BATCH_MIN_STATES, QualityGateConfig
+
+STATES = [
+    {},
+    {"client_brief": {"company_info": {}, "target_audience": {}}},
+    {"generated_logos": {"quality_scores": [0.9, 0.6]}},
+    {"generated_logos": {"quality_scores": ["0.9"]}},
+    {"generated_logos": {"quality_scores": []}},
+]
+
+
+@pytest.mark.parametrize("phase", list(WorkflowPhase))
+def test_batch_matches_validate_phase(phase):
+    states = STATES * (BATCH_MIN_STATES // len(STATES) + 1)
+    assert len(states) > BATCH_MIN_STATES
+
+    expected = [QualityGateConfig.validate_phase(phase, state) for state in states]
+    assert QualityGateConfig.validate_phase_batch(phase, states) == expected
+
+
+def test_batch_fails_non_numeric_scores_like_validate_phase():
+    state = {"generated_logos": {"quality_scores": ["0.9"]}}
+    states = [state] * (BATCH_MIN_STATES + 1)
+
+    results = QualityGateConfig.validate_phase_batch(WorkflowPhase.LOGO, states)
+
+    assert QualityGateConfig.validate_phase(WorkflowPhase.LOGO, state) == results[0]
+    assert not any(result["overall_passed"] for result in results)
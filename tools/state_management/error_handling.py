@@ -1,12 +1,16 @@
 """Error handling and recovery system for branding workflow"""
 
+import re
 import time
 import traceback
+from collections import deque
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, List, MutableSequence, Optional, Sequence
 
 from google.adk.tools import ToolContext
 
+from agents.base.agent_functions import ensure_state_container
 from agents.base.state_schema import StateKeys, WorkflowPhase
 
 
@@ -30,11 +34,43 @@ class ErrorCategory(str, Enum):
     FILE_PROCESSING = "file_processing"  # File upload/processing errors
 
 
+# Errors kept by an ErrorHandler and per session; escalation only looks at the last 10
+MAX_ERROR_HISTORY = 64
+ESCALATION_WINDOW = 10
+
+# Message keywords per category, in precedence order
+_CATEGORY_INDICATORS = {
+    ErrorCategory.VALIDATION: ["validation", "missing", "required", "invalid"],
+    ErrorCategory.TOOL_EXECUTION: ["tool", "execution", "failed", "timeout"],
+    ErrorCategory.QUALITY: ["quality", "threshold", "score", "gate"],
+    ErrorCategory.WORKFLOW: ["transition", "phase", "workflow", "state"],
+    ErrorCategory.EXTERNAL_API: ["api", "connection", "rate limit", "service"],
+    ErrorCategory.FILE_PROCESSING: ["file", "upload", "format", "processing"],
+}
+
+# One compiled alternation per category, searched in precedence order
+_CATEGORY_PATTERNS = [
+    (category, re.compile("|".join(map(re.escape, indicators)), re.IGNORECASE))
+    for category, indicators in _CATEGORY_INDICATORS.items()
+]
+
+_CRITICAL_TYPES = frozenset({"SystemExit", "KeyboardInterrupt", "MemoryError"})
+
+_CATEGORY_SEVERITY = {
+    ErrorCategory.WORKFLOW: ErrorSeverity.HIGH,
+    ErrorCategory.EXTERNAL_API: ErrorSeverity.HIGH,
+    ErrorCategory.QUALITY: ErrorSeverity.MEDIUM,
+    ErrorCategory.TOOL_EXECUTION: ErrorSeverity.MEDIUM,
+    ErrorCategory.VALIDATION: ErrorSeverity.LOW,
+    ErrorCategory.FILE_PROCESSING: ErrorSeverity.LOW,
+}
+
+
 class ErrorHandler:
     """Central error handling and recovery logic"""
 
     def __init__(self):
-        self.error_history = []
+        self.error_history: Deque[Dict[str, Any]] = deque(maxlen=MAX_ERROR_HISTORY)
         self.recovery_strategies = self._setup_recovery_strategies()
         self.escalation_thresholds = {
             ErrorSeverity.LOW: 5,  # 5 low errors before escalation
@@ -43,18 +79,30 @@ class ErrorHandler:
             ErrorSeverity.CRITICAL: 0,  # Immediate escalation
         }
 
-    def handle_error(self, error: Exception, context: Dict[str, Any]) -> Dict[str, Any]:
+    def handle_error(
+        self,
+        error: Exception,
+        context: Dict[str, Any],
+        error_history: Optional[MutableSequence[Dict[str, Any]]] = None,
+        capture_traceback: bool = True,
+    ) -> Dict[str, Any]:
         """Main error handling entry point"""
-        error_info = self._classify_error(error, context)
+        # Shared handlers record into the caller's (e.g. session) history
+        if error_history is None:
+            error_history = self.error_history
+
+        error_info = self._classify_error(
+            error, context, error_history, capture_traceback
+        )
 
         # Record error
-        self.error_history.append(error_info)
+        error_history.append(error_info)
 
         # Attempt recovery
         recovery_result = self._attempt_recovery(error_info, context)
 
         # Check escalation
-        escalation_needed = self._check_escalation(error_info, context)
+        escalation_needed = self._check_escalation(error_info, error_history)
 
         return {
             "error_info": error_info,
@@ -67,7 +115,11 @@ class ErrorHandler:
         }
 
     def _classify_error(
-        self, error: Exception, context: Dict[str, Any]
+        self,
+        error: Exception,
+        context: Dict[str, Any],
+        error_history: Sequence[Dict[str, Any]],
+        capture_traceback: bool = True,
     ) -> Dict[str, Any]:
         """Classify error by type, severity, and category"""
         error_type = type(error).__name__
@@ -79,15 +131,22 @@ class ErrorHandler:
         # Determine severity
         severity = self._determine_severity(error_type, category, context)
 
+        # Only raised exceptions carry a traceback worth formatting
+        stack_trace = ""
+        if capture_traceback and error.__traceback__ is not None:
+            stack_trace = "".join(
+                traceback.format_exception(type(error), error, error.__traceback__)
+            )
+
         return {
-            "error_id": f"err_{int(time.time())}_{len(self.error_history)}",
+            "error_id": f"err_{time.time_ns()}_{len(error_history)}",
             "error_type": error_type,
             "error_message": error_message,
             "category": category,
             "severity": severity,
             "timestamp": time.time(),
             "context": context,
-            "stack_trace": traceback.format_exc(),
+            "stack_trace": stack_trace,
             "phase": context.get("current_phase"),
             "agent": context.get("current_agent"),
         }
@@ -96,18 +155,8 @@ class ErrorHandler:
         self, error_type: str, message: str, context: Dict[str, Any]
     ) -> ErrorCategory:
         """Determine error category based on type and context"""
-        category_indicators = {
-            ErrorCategory.VALIDATION: ["validation", "missing", "required", "invalid"],
-            ErrorCategory.TOOL_EXECUTION: ["tool", "execution", "failed", "timeout"],
-            ErrorCategory.QUALITY: ["quality", "threshold", "score", "gate"],
-            ErrorCategory.WORKFLOW: ["transition", "phase", "workflow", "state"],
-            ErrorCategory.EXTERNAL_API: ["api", "connection", "rate limit", "service"],
-            ErrorCategory.FILE_PROCESSING: ["file", "upload", "format", "processing"],
-        }
-
-        message_lower = message.lower()
-        for category, indicators in category_indicators.items():
-            if any(indicator in message_lower for indicator in indicators):
+        for category, pattern in _CATEGORY_PATTERNS:
+            if pattern.search(message):
                 return category
 
         return ErrorCategory.TOOL_EXECUTION  # Default
@@ -116,22 +165,14 @@ class ErrorHandler:
         self, error_type: str, category: ErrorCategory, context: Dict[str, Any]
     ) -> ErrorSeverity:
         """Determine error severity"""
-        # Critical errors
-        if error_type in ["SystemExit", "KeyboardInterrupt", "MemoryError"]:
+        if error_type in _CRITICAL_TYPES:
             return ErrorSeverity.CRITICAL
 
-        # High severity by category
-        if category in [ErrorCategory.WORKFLOW, ErrorCategory.EXTERNAL_API]:
-            return ErrorSeverity.HIGH
-
-        # Medium severity
-        if category in [ErrorCategory.QUALITY, ErrorCategory.TOOL_EXECUTION]:
-            return ErrorSeverity.MEDIUM
-
-        # Low severity for validation and file processing
-        return ErrorSeverity.LOW
+        return _CATEGORY_SEVERITY.get(category, ErrorSeverity.LOW)
 
-    def _setup_recovery_strategies(self) -> Dict[ErrorCategory, List[Callable]]:
+    def _setup_recovery_strategies(
+        self,
+    ) -> Dict[ErrorCategory, List[Callable[..., Optional[Dict[str, Any]]]]]:
         """Setup recovery strategies for each error category"""
         return {
             ErrorCategory.VALIDATION: [
@@ -170,35 +211,37 @@ class ErrorHandler:
         self, error_info: Dict[str, Any], context: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Attempt to recover from error using appropriate strategy"""
-        category = ErrorCategory(error_info["category"])
-        strategies = self.recovery_strategies.get(category, [])
+        # _classify_error already stores the category as an ErrorCategory
+        strategies = self.recovery_strategies.get(error_info["category"], [])
 
+        # Strategies return None when they do not apply
         for strategy in strategies:
             try:
                 result = strategy(error_info, context)
-                if result.get("successful"):
-                    return {
-                        "attempted": True,
-                        "successful": True,
-                        "strategy": strategy.__name__,
-                        "result": result,
-                    }
-            except Exception as recovery_error:
-                continue
+            except Exception:
+                continue  # A failing strategy must not escape the error handler
+            if result is not None and result.get("successful"):
+                return {
+                    "attempted": True,
+                    "successful": True,
+                    "strategy": strategy.__name__,
+                    "result": result,
+                }
 
         return {"attempted": True, "successful": False}
 
     def _check_escalation(
-        self, error_info: Dict[str, Any], context: Dict[str, Any]
+        self, error_info: Dict[str, Any], error_history: Sequence[Dict[str, Any]]
     ) -> bool:
         """Check if error should trigger human escalation"""
         severity = ErrorSeverity(error_info["severity"])
 
         # Count recent errors of this severity
-        recent_errors = [
-            e for e in self.error_history[-10:] if e["severity"] == severity.value
-        ]
-        error_count = len(recent_errors)
+        error_count = sum(
+            1
+            for e in islice(reversed(error_history), ESCALATION_WINDOW)
+            if e["severity"] == severity.value
+        )
 
         threshold = self.escalation_thresholds.get(severity, 1)
         return error_count >= threshold
@@ -227,12 +270,12 @@ class ErrorHandler:
 
     def _retry_with_backoff(
         self, error_info: Dict[str, Any], context: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        retry_count = context.get("retry_count", 0)
-        if retry_count < 3:
-            time.sleep(2**retry_count)  # 1s, 2s, 4s
-            return {"successful": True, "action": "retry_scheduled"}
-        return {"successful": False, "reason": "Max retries exceeded"}
+    ) -> Optional[Dict[str, Any]]:
+        retry_count = int(context.get("retry_count") or 0)
+        if retry_count >= 3:
+            return None  # Max retries exceeded
+        time.sleep(2**retry_count)  # 1s, 2s, 4s
+        return {"successful": True, "action": "retry_scheduled"}
 
     def _use_alternative_tool(
         self, error_info: Dict[str, Any], context: Dict[str, Any]
@@ -271,7 +314,7 @@ class ErrorHandler:
 
     def _retry_with_exponential_backoff(
         self, error_info: Dict[str, Any], context: Dict[str, Any]
-    ) -> Dict[str, Any]:
+    ) -> Optional[Dict[str, Any]]:
         return self._retry_with_backoff(error_info, context)
 
     def _use_fallback_api(
@@ -315,12 +358,23 @@ class ErrorHandler:
         return {"successful": True, "action": "manual_quality_override"}
 
 
+# Shared handler; per-session error history lives in tool_context.state
+_ERROR_HANDLER = ErrorHandler()
+
+# State keys used on every workflow error
+_CURRENT_PHASE = StateKeys.CURRENT_PHASE
+_RETRY_COUNT = StateKeys.RETRY_COUNT
+_LAST_ERROR = StateKeys.LAST_ERROR
+_ESCALATION_TRIGGERED = StateKeys.ESCALATION_TRIGGERED
+
+
 # ADK v1.0.0 Function Tools
 def handle_workflow_error(
     error_message: str, error_context: Dict[str, Any], tool_context: ToolContext
 ) -> Dict[str, Any]:
     """Handle errors and attempt recovery in workflow"""
-    error_handler = ErrorHandler()
+    state = tool_context.state
+    retry_count = state.get(_RETRY_COUNT, 0)
 
     # Create mock exception from message
     mock_error = Exception(error_message)
@@ -328,26 +382,27 @@ def handle_workflow_error(
     # Add current state context
     full_context = {
         **error_context,
-        "current_phase": tool_context.state.get(StateKeys.CURRENT_PHASE),
-        "retry_count": tool_context.state.get(StateKeys.RETRY_COUNT, 0),
-        "session_state": tool_context.state,
+        "current_phase": state.get(_CURRENT_PHASE),
+        "retry_count": retry_count,
+        "session_state": state,
     }
 
-    # Handle error
-    result = error_handler.handle_error(mock_error, full_context)
+    # Handle error, recording it in the session's error log
+    error_log = ensure_state_container(state, "error_log")
+    result = _ERROR_HANDLER.handle_error(
+        mock_error, full_context, error_log, capture_traceback=False
+    )
+    del error_log[:-MAX_ERROR_HISTORY]
 
     # Update state with error info
-    tool_context.state.setdefault("error_log", []).append(result["error_info"])
-    tool_context.state[StateKeys.LAST_ERROR] = result["error_info"]["error_message"]
+    state[_LAST_ERROR] = result["error_info"]["error_message"]
 
     # Update retry count if retrying
     if result["recommended_action"] == "retry_operation":
-        tool_context.state[StateKeys.RETRY_COUNT] = (
-            tool_context.state.get(StateKeys.RETRY_COUNT, 0) + 1
-        )
+        state[_RETRY_COUNT] = retry_count + 1
 
     # Trigger escalation if needed
     if result["escalation_needed"]:
-        tool_context.state[StateKeys.ESCALATION_TRIGGERED] = True
+        state[_ESCALATION_TRIGGERED] = True
 
     return result
@@ -1,119 +1,159 @@
 """Quality control and assurance system"""
 
 import time
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Union
 
 from google.adk.tools import ToolContext
 
+from agents.base.agent_functions import ensure_state_container
 from agents.base.state_schema import StateKeys, WorkflowPhase
 
-
-class QualityController:
-    """Central quality control system"""
-
-    def __init__(self):
-        self.quality_standards = self._setup_quality_standards()
-        self.quality_history = []
-
-    def _setup_quality_standards(self) -> Dict[str, Dict[str, float]]:
-        """Setup quality standards for each phase"""
-        return {
-            WorkflowPhase.DISCOVERY.value: {
+# Quality standards per phase value, built once and shared read-only
+_QUALITY_STANDARDS: Mapping[str, Mapping[str, float]] = MappingProxyType(
+    {
+        WorkflowPhase.DISCOVERY.value: MappingProxyType(
+            {
                 "completeness_score": 0.9,
                 "clarity_score": 0.8,
                 "actionability_score": 0.8,
-            },
-            WorkflowPhase.RESEARCH.value: {
+            }
+        ),
+        WorkflowPhase.RESEARCH.value: MappingProxyType(
+            {
                 "depth_score": 0.8,
                 "relevance_score": 0.9,
                 "strategic_value_score": 0.7,
-            },
-            WorkflowPhase.VISUAL.value: {
+            }
+        ),
+        WorkflowPhase.VISUAL.value: MappingProxyType(
+            {
                 "coherence_score": 0.8,
                 "strategic_alignment_score": 0.9,
                 "executability_score": 0.8,
-            },
-            WorkflowPhase.LOGO.value: {
+            }
+        ),
+        WorkflowPhase.LOGO.value: MappingProxyType(
+            {
                 "professional_quality_score": 0.8,
                 "scalability_score": 0.9,
                 "brand_alignment_score": 0.8,
-            },
-            WorkflowPhase.BRAND.value: {
+            }
+        ),
+        WorkflowPhase.BRAND.value: MappingProxyType(
+            {
                 "completeness_score": 0.9,
                 "clarity_score": 0.9,
                 "professional_standards_score": 0.8,
-            },
-            WorkflowPhase.ASSETS.value: {
+            }
+        ),
+        WorkflowPhase.ASSETS.value: MappingProxyType(
+            {
                 "format_compliance_score": 0.9,
                 "quality_consistency_score": 0.8,
                 "completeness_score": 0.9,
-            },
-        }
+            }
+        ),
+    }
+)
+
+# Mock evaluation scores - replace with real metric evaluation
+_METRIC_SCORES: Dict[str, float] = {
+    "completeness_score": 0.9,
+    "clarity_score": 0.85,
+    "actionability_score": 0.82,
+    "depth_score": 0.83,
+    "relevance_score": 0.88,
+    "strategic_value_score": 0.79,
+    "coherence_score": 0.87,
+    "strategic_alignment_score": 0.91,
+    "executability_score": 0.84,
+    "professional_quality_score": 0.86,
+    "scalability_score": 0.92,
+    "brand_alignment_score": 0.89,
+    "professional_standards_score": 0.90,
+    "format_compliance_score": 0.93,
+    "quality_consistency_score": 0.87,
+}
+
+_NO_STANDARDS: Mapping[str, float] = MappingProxyType({})
+
+
+class QualityController:
+    """Central quality control system"""
+
+    def __init__(self):
+        self.quality_standards = _QUALITY_STANDARDS
+        self.quality_history = []
 
     def evaluate_phase_quality(
-        self, phase: str, deliverable: Dict[str, Any], context: Dict[str, Any]
+        self,
+        phase: Union[WorkflowPhase, str],
+        deliverable: Dict[str, Any],
+        context: Dict[str, Any],
+        quality_history: Optional[List[Dict[str, Any]]] = None,
     ) -> Dict[str, Any]:
         """Evaluate quality of phase deliverable"""
-        standards = self.quality_standards.get(phase, {})
+        # str-mixin phases also match their raw values
+        standards = self.quality_standards.get(phase, _NO_STANDARDS)
+        total_checks = len(standards)
+
+        # Nothing to evaluate for phases without standards; keep it out of history
+        if not total_checks:
+            return {
+                "phase": phase,
+                "overall_score": 0.0,
+                "quality_passed": True,
+                "passed_checks": 0,
+                "total_checks": 0,
+                "detailed_scores": {},
+                "evaluation_timestamp": time.time(),
+            }
 
         quality_scores = {}
         overall_score = 0.0
         passed_checks = 0
-        total_checks = len(standards)
 
         for metric, threshold in standards.items():
             # Mock quality evaluation - replace with real evaluation logic
             score = self._evaluate_metric(metric, deliverable, context)
+            passed = score >= threshold
             quality_scores[metric] = {
                 "score": score,
                 "threshold": threshold,
-                "passed": score >= threshold,
+                "passed": passed,
             }
 
             overall_score += score
-            if score >= threshold:
+            if passed:
                 passed_checks += 1
 
-        overall_score = overall_score / total_checks if total_checks > 0 else 0.0
-        quality_passed = passed_checks == total_checks
-
         quality_result = {
             "phase": phase,
-            "overall_score": overall_score,
-            "quality_passed": quality_passed,
+            "overall_score": overall_score / total_checks,
+            "quality_passed": passed_checks == total_checks,
             "passed_checks": passed_checks,
             "total_checks": total_checks,
             "detailed_scores": quality_scores,
             "evaluation_timestamp": time.time(),
         }
 
-        self.quality_history.append(quality_result)
+        # Shared controllers record into the caller's (e.g. session) history
+        if quality_history is None:
+            quality_history = self.quality_history
+        quality_history.append(quality_result)
         return quality_result
 
     def _evaluate_metric(
         self, metric: str, deliverable: Dict[str, Any], context: Dict[str, Any]
     ) -> float:
         """Evaluate specific quality metric (mock implementation)"""
-        # Mock evaluation scores - replace with real metric evaluation
-        metric_scores = {
-            "completeness_score": 0.9,
-            "clarity_score": 0.85,
-            "actionability_score": 0.82,
-            "depth_score": 0.83,
-            "relevance_score": 0.88,
-            "strategic_value_score": 0.79,
-            "coherence_score": 0.87,
-            "strategic_alignment_score": 0.91,
-            "executability_score": 0.84,
-            "professional_quality_score": 0.86,
-            "scalability_score": 0.92,
-            "brand_alignment_score": 0.89,
-            "professional_standards_score": 0.90,
-            "format_compliance_score": 0.93,
-            "quality_consistency_score": 0.87,
-        }
+        return _METRIC_SCORES.get(metric, 0.8)  # Default score
+
 
-        return metric_scores.get(metric, 0.8)  # Default score
+# Shared controller; per-session quality history lives in tool_context.state
+_QUALITY_CONTROLLER = QualityController()
+_QUALITY_SCORES = StateKeys.QUALITY_SCORES
 
 
 # ADK v1.0.0 Function Tool
@@ -121,23 +161,21 @@ def quality_assurance_check(
     phase: str, deliverable_key: str, tool_context: ToolContext
 ) -> Dict[str, Any]:
     """Perform comprehensive quality assurance on phase deliverable"""
-    quality_controller = QualityController()
-    deliverable = tool_context.state.get(deliverable_key, {})
+    state = tool_context.state
+    deliverable = state.get(deliverable_key, {})
 
-    # Evaluate quality
-    quality_result = quality_controller.evaluate_phase_quality(
-        phase, deliverable, {"session_state": tool_context.state}
+    # Evaluate quality, recording it in the session's quality history
+    quality_evaluations = ensure_state_container(state, "quality_evaluations")
+    quality_result = _QUALITY_CONTROLLER.evaluate_phase_quality(
+        phase, deliverable, {"session_state": state}, quality_evaluations
     )
 
     # Update state with quality scores
-    tool_context.state.setdefault(StateKeys.QUALITY_SCORES, {}).update(
+    ensure_state_container(state, _QUALITY_SCORES, dict).update(
         {
             f"{phase}_overall_score": quality_result["overall_score"],
             f"{phase}_quality_passed": quality_result["quality_passed"],
         }
     )
 
-    # Add to quality history
-    tool_context.state.setdefault("quality_evaluations", []).append(quality_result)
-
     return quality_result
@@ -1,8 +1,10 @@
 """Session management utilities for ADK v1.2.1"""
 
+import asyncio
+import secrets
+import threading
 import time
-import uuid
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from google.adk.sessions import InMemorySessionService
 from google.adk.tools import ToolContext
@@ -21,14 +23,18 @@ class SessionManager:
 
     def __init__(self):
         self.session_service = InMemorySessionService()
-        self.active_sessions = {}
+        self.active_sessions: Dict[str, Dict[str, Any]] = {}
 
     async def create_project_session(
         self, client_id: str, project_name: str
     ) -> Dict[str, Any]:
         """Create new project session"""
 
-        project_id = f"proj_{int(time.time())}_{uuid.uuid4().hex[:8]}"
+        # One clock read per session so all its timestamps agree
+        now_ns = time.time_ns()
+        now = now_ns / 1e9
+
+        project_id = f"proj_{now_ns}_{secrets.token_hex(4)}"
         session_id = f"session_{project_id}"
 
         # Initialize session state
@@ -37,7 +43,7 @@ class SessionManager:
             StateKeys.CURRENT_PHASE: WorkflowPhase.DISCOVERY.value,
             StateKeys.CLIENT_ID: client_id,
             StateKeys.PROJECT_ID: project_id,
-            "created_timestamp": time.time(),
+            "created_timestamp": now,
             "project_name": project_name,
             "uploaded_files": [],
             "progress_tracking": {},
@@ -56,30 +62,65 @@ class SessionManager:
         self.active_sessions[project_id] = {
             "session_id": session_id,
             "client_id": client_id,
-            "created_at": time.time(),
-            "last_activity": time.time(),
+            "created_at": now,
+            "last_activity": now,
         }
 
         return {
             "project_id": project_id,
             "session_id": session_id,
             "initial_state": initial_state,
-            "created_at": time.time(),
+            "created_at": now,
         }
 
+    def create_project_session_sync(
+        self, client_id: str, project_name: str
+    ) -> Dict[str, Any]:
+        """Create new project session from synchronous code"""
+        future = asyncio.run_coroutine_threadsafe(
+            self.create_project_session(client_id, project_name), _get_session_loop()
+        )
+        return future.result()
+
+
+# Shared manager so active_sessions survives across tool calls; built on first use
+_SESSION_MANAGER: Optional[SessionManager] = None
+_SESSION_LOCK = threading.Lock()
+
+# Long-lived loop for sync callers; works whether or not the caller is in a loop
+_SESSION_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_session_loop() -> asyncio.AbstractEventLoop:
+    """Return the background session event loop, starting it once"""
+    global _SESSION_LOOP
+    if _SESSION_LOOP is None:
+        with _SESSION_LOCK:
+            if _SESSION_LOOP is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="session-loop", daemon=True
+                ).start()
+                _SESSION_LOOP = loop
+    return _SESSION_LOOP
+
+
+def _get_session_manager() -> SessionManager:
+    """Return the shared SessionManager, creating it once"""
+    global _SESSION_MANAGER
+    if _SESSION_MANAGER is None:
+        with _SESSION_LOCK:
+            if _SESSION_MANAGER is None:
+                _SESSION_MANAGER = SessionManager()
+    return _SESSION_MANAGER
+
 
 # ADK v1.0.0 Function Tools
 def create_session(
     client_id: str, project_name: str, tool_context: ToolContext
 ) -> Dict[str, Any]:
     """Create new project session"""
-    session_manager = SessionManager()
-    # Use asyncio.run for demo - in production use proper async context
-    import asyncio
-
-    result = asyncio.run(
-        session_manager.create_project_session(client_id, project_name)
-    )
+    result = _get_session_manager().create_project_session_sync(client_id, project_name)
 
     # Update tool context state
     tool_context.state.update(result["initial_state"])
@@ -91,11 +132,12 @@ def update_session_state(
     state_updates: Dict[str, Any], tool_context: ToolContext
 ) -> Dict[str, Any]:
     """Update session state with new data"""
+    now = time.time()
     tool_context.state.update(state_updates)
-    tool_context.state["last_updated"] = time.time()
+    tool_context.state["last_updated"] = now
 
     return {
         "success": True,
         "updated_keys": list(state_updates.keys()),
-        "timestamp": time.time(),
+        "timestamp": now,
     }
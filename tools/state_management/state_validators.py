@@ -1,11 +1,21 @@
 """State validation tools for workflow transitions"""
 
 import time
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, Tuple
 
 from google.adk.tools import ToolContext
+from pydantic import TypeAdapter, ValidationError
 
-from agents.base.state_schema import SessionState, StateKeys, WorkflowPhase
+from agents.base.state_schema import (
+    SessionState,
+    StateKeys,
+    WorkflowPhase,
+    coerce_phase,
+)
+
+# Schema validator built once instead of per validate_state_schema call
+_SESSION_STATE_ADAPTER = TypeAdapter(SessionState)
 
 
 class StateValidator:
@@ -13,12 +23,12 @@ class StateValidator:
 
     # Required state keys for each phase completion
     PHASE_REQUIREMENTS = {
-        WorkflowPhase.DISCOVERY: [StateKeys.CLIENT_BRIEF],
-        WorkflowPhase.RESEARCH: [StateKeys.MARKET_RESEARCH],
-        WorkflowPhase.VISUAL: [StateKeys.VISUAL_DIRECTION],
-        WorkflowPhase.LOGO: [StateKeys.SELECTED_LOGO],
-        WorkflowPhase.BRAND: [StateKeys.BRAND_SYSTEM],
-        WorkflowPhase.ASSETS: [StateKeys.FINAL_ASSETS],
+        WorkflowPhase.DISCOVERY: (StateKeys.CLIENT_BRIEF,),
+        WorkflowPhase.RESEARCH: (StateKeys.MARKET_RESEARCH,),
+        WorkflowPhase.VISUAL: (StateKeys.VISUAL_DIRECTION,),
+        WorkflowPhase.LOGO: (StateKeys.SELECTED_LOGO,),
+        WorkflowPhase.BRAND: (StateKeys.BRAND_SYSTEM,),
+        WorkflowPhase.ASSETS: (StateKeys.FINAL_ASSETS,),
     }
 
     @classmethod
@@ -26,34 +36,43 @@ class StateValidator:
         cls, state: Dict[str, Any], phase: WorkflowPhase
     ) -> bool:
         """Check if phase has required state keys"""
-        required_keys = cls.PHASE_REQUIREMENTS.get(phase, [])
-        return all(key in state and state[key] is not None for key in required_keys)
+        return not cls.get_missing_requirements(state, phase)
 
     @classmethod
     def get_missing_requirements(
         cls, state: Dict[str, Any], phase: WorkflowPhase
-    ) -> List[str]:
-        """Get list of missing state keys for phase"""
-        required_keys = cls.PHASE_REQUIREMENTS.get(phase, [])
-        return [key for key in required_keys if key not in state or state[key] is None]
+    ) -> Tuple[str, ...]:
+        """Get missing state keys for phase"""
+        required_keys = cls.PHASE_REQUIREMENTS.get(phase, ())
+        mask = tuple(state.get(key) is not None for key in required_keys)
+        if all(mask):
+            return ()
+        return _missing_for_mask(phase, mask)
 
     @classmethod
     def validate_state_schema(cls, state: Dict[str, Any]) -> bool:
         """Validate state against SessionState schema"""
         try:
-            SessionState(**state)
+            _SESSION_STATE_ADAPTER.validate_python(state)
             return True
-        except Exception:
+        except ValidationError:
             return False
 
 
+@lru_cache(maxsize=1024)
+def _missing_for_mask(phase: WorkflowPhase, mask: Tuple[bool, ...]) -> Tuple[str, ...]:
+    """Missing keys for a phase given which required keys are present"""
+    required_keys = StateValidator.PHASE_REQUIREMENTS.get(phase, ())
+    return tuple(key for key, present in zip(required_keys, mask) if not present)
+
+
 # Modern ADK v1.0.0 Function-based Tools
 def validate_phase_transition(
     current_phase: str, target_phase: str, tool_context: ToolContext
 ) -> Dict[str, Any]:
     """Validate state for moving to next workflow phase"""
-    current = WorkflowPhase(current_phase)
-    target = WorkflowPhase(target_phase)
+    current = coerce_phase(current_phase)
+    target = coerce_phase(target_phase)
 
     # Check current phase completion
     is_complete = StateValidator.validate_phase_completion(tool_context.state, current)
@@ -72,4 +91,4 @@ def validate_phase_transition_helper(
     state: Dict[str, Any], from_phase: str, to_phase: str
 ) -> bool:
     """Helper function for phase transition validation"""
-    return StateValidator.validate_phase_completion(state, WorkflowPhase(from_phase))
+    return StateValidator.validate_phase_completion(state, coerce_phase(from_phase))
@@ -1,57 +1,87 @@
 """Workflow orchestration and agent handoff logic"""
 
 import time
-from typing import Any, Dict, List, Optional
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
 
 from google.adk.tools import ToolContext
 
-from agents.base.state_schema import StateKeys, WorkflowPhase
+from agents.base.agent_functions import ensure_state_container
+from agents.base.state_schema import StateKeys, WorkflowPhase, coerce_phase
 from config.agent_configs.quality_gates import QualityGateConfig
 from config.agent_configs.workflow_config import WorkflowTransition, WorkflowTriggers
+from tools.state_management.state_validators import StateValidator
+
+_DEFAULT_PHASE_VALUE = WorkflowPhase.DISCOVERY.value
+
+# Transitions kept by a WorkflowManager, and per session in state
+MAX_TRANSITION_HISTORY = 1024
+MAX_STATE_TRANSITION_HISTORY = 256
 
 
 class WorkflowManager:
     """Manages workflow transitions and agent orchestration"""
 
     def __init__(self):
-        self.transition_history = []
+        self.transition_history: Deque[Dict[str, Any]] = deque(
+            maxlen=MAX_TRANSITION_HISTORY
+        )
 
     def get_current_phase(self, state: Dict[str, Any]) -> WorkflowPhase:
         """Get current workflow phase"""
-        phase_str = state.get(StateKeys.CURRENT_PHASE, WorkflowPhase.DISCOVERY.value)
-        return WorkflowPhase(phase_str)
+        phase_str = state.get(StateKeys.CURRENT_PHASE, _DEFAULT_PHASE_VALUE)
+        return coerce_phase(phase_str)
 
-    def can_proceed_to_next_phase(self, state: Dict[str, Any]) -> Dict[str, Any]:
-        """Check if workflow can proceed to next phase"""
+    def snapshot(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Evaluate phase, gates and requirements once for reuse within a call"""
         current_phase = self.get_current_phase(state)
         next_phase = WorkflowTransition.get_next_phase(current_phase)
 
         if not next_phase:
-            return {"can_proceed": False, "reason": "Already at final phase"}
+            return {
+                "current_phase": current_phase,
+                "next_phase": None,
+                "gate_results": None,
+                "requirements_met": False,
+                "next_agent": None,
+                "can_proceed": False,
+            }
 
         # Validate quality gates
         gate_results = QualityGateConfig.validate_phase(current_phase, state)
 
         # Check state requirements
-        from tools.state_management.state_validators import StateValidator
-
         requirements_met = StateValidator.validate_phase_completion(
             state, current_phase
         )
 
-        can_proceed = gate_results["overall_passed"] and requirements_met
-
         return {
-            "can_proceed": can_proceed,
-            "current_phase": current_phase.value,
-            "next_phase": next_phase.value if next_phase else None,
-            "quality_gates": gate_results,
+            "current_phase": current_phase,
+            "next_phase": next_phase,
+            "gate_results": gate_results,
             "requirements_met": requirements_met,
-            "next_agent": (
-                WorkflowTransition.get_responsible_agent(next_phase)
-                if next_phase
-                else None
-            ),
+            "next_agent": WorkflowTransition.get_responsible_agent(next_phase),
+            "can_proceed": gate_results["overall_passed"] and requirements_met,
+        }
+
+    def can_proceed_to_next_phase(
+        self, state: Dict[str, Any], snapshot: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Check if workflow can proceed to next phase"""
+        if snapshot is None:
+            snapshot = self.snapshot(state)
+
+        next_phase = snapshot["next_phase"]
+        if not next_phase:
+            return {"can_proceed": False, "reason": "Already at final phase"}
+
+        return {
+            "can_proceed": snapshot["can_proceed"],
+            "current_phase": snapshot["current_phase"].value,
+            "next_phase": next_phase.value,
+            "quality_gates": snapshot["gate_results"],
+            "requirements_met": snapshot["requirements_met"],
+            "next_agent": snapshot["next_agent"],
         }
 
     def transition_to_phase(
@@ -75,14 +105,21 @@ class WorkflowManager:
         # Update state
         state[StateKeys.CURRENT_PHASE] = target_phase.value
         state["last_transition"] = transition
-        state.setdefault("transition_history", []).append(transition)
+        transition_history = ensure_state_container(state, "transition_history")
+        transition_history.append(transition)
+        del transition_history[:-MAX_STATE_TRANSITION_HISTORY]
 
         self.transition_history.append(transition)
         return True
 
-    def get_next_agent(self, state: Dict[str, Any]) -> Optional[str]:
+    def get_next_agent(
+        self, state: Dict[str, Any], snapshot: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
         """Determine which agent should run next"""
-        current_phase = self.get_current_phase(state)
+        if snapshot is None:
+            current_phase = self.get_current_phase(state)
+        else:
+            current_phase = snapshot["current_phase"]
 
         # Check if current phase agent can be triggered
         current_agent = WorkflowTransition.get_responsible_agent(current_phase)
@@ -90,20 +127,25 @@ class WorkflowManager:
             return current_agent
 
         # Check if we can move to next phase
-        next_check = self.can_proceed_to_next_phase(state)
-        if next_check["can_proceed"]:
-            return next_check["next_agent"]
+        if snapshot is None:
+            snapshot = self.snapshot(state)
+        if snapshot["can_proceed"]:
+            return snapshot["next_agent"]
 
         return None
 
 
+# Shared manager; transition_history accumulates across tool calls
+_WORKFLOW_MANAGER = WorkflowManager()
+
+
 # ADK v1.0.0 Modern Function Tools
 def transition_workflow_phase(
     target_phase: str, tool_context: ToolContext
 ) -> Dict[str, Any]:
     """Transition workflow to next phase with validation"""
-    workflow_manager = WorkflowManager()
-    target = WorkflowPhase(target_phase)
+    workflow_manager = _WORKFLOW_MANAGER
+    target = coerce_phase(target_phase)
     current_phase = workflow_manager.get_current_phase(tool_context.state)
 
     # Check if transition is valid
@@ -128,17 +170,18 @@ def transition_workflow_phase(
 
     if success:
         # Update quality scores
-        tool_context.state.setdefault(StateKeys.QUALITY_SCORES, {})
-        tool_context.state[StateKeys.QUALITY_SCORES][
-            f"{current_phase.value}_transition"
-        ] = 1.0
+        quality_scores = ensure_state_container(
+            tool_context.state, StateKeys.QUALITY_SCORES, dict
+        )
+        quality_scores[f"{current_phase.value}_transition"] = 1.0
 
+        transition = tool_context.state["last_transition"]
         return {
             "success": True,
             "from_phase": current_phase.value,
             "to_phase": target_phase,
-            "next_agent": WorkflowTransition.get_responsible_agent(target),
-            "timestamp": time.time(),
+            "next_agent": transition["agent"],
+            "timestamp": transition["timestamp"],
         }
 
     return {
@@ -150,12 +193,14 @@ def transition_workflow_phase(
 
 def get_next_agent(tool_context: ToolContext) -> Dict[str, Any]:
     """Determine which agent should run next based on workflow state"""
-    workflow_manager = WorkflowManager()
-    current_phase = workflow_manager.get_current_phase(tool_context.state)
-    next_agent = workflow_manager.get_next_agent(tool_context.state)
+    workflow_manager = _WORKFLOW_MANAGER
+    state = tool_context.state
+    snapshot = workflow_manager.snapshot(state)
+    current_phase = snapshot["current_phase"]
+    next_agent = workflow_manager.get_next_agent(state, snapshot)
 
     # Get workflow status
-    can_proceed = workflow_manager.can_proceed_to_next_phase(tool_context.state)
+    can_proceed = workflow_manager.can_proceed_to_next_phase(state, snapshot)
 
     return {
         "current_phase": current_phase.value,
@@ -163,7 +208,7 @@ def get_next_agent(tool_context: ToolContext) -> Dict[str, Any]:
         "can_proceed_to_next": can_proceed["can_proceed"],
         "workflow_status": can_proceed,
         "available_transitions": WorkflowTransition.VALID_TRANSITIONS.get(
-            current_phase, []
+            current_phase, ()
         ),
         "timestamp": time.time(),
     }
@@ -172,23 +217,17 @@ def get_next_agent(tool_context: ToolContext) -> Dict[str, Any]:
 def validate_workflow_state(tool_context: ToolContext) -> Dict[str, Any]:
     """Comprehensive validation of current workflow state"""
     state = tool_context.state
-    current_phase = WorkflowPhase(
-        state.get(StateKeys.CURRENT_PHASE, WorkflowPhase.DISCOVERY.value)
-    )
+    phase_str = state.get(StateKeys.CURRENT_PHASE, _DEFAULT_PHASE_VALUE)
+    current_phase = coerce_phase(phase_str)
 
     # Run quality gates
     quality_results = QualityGateConfig.validate_phase(current_phase, state)
 
     # Check state completeness
-    from tools.state_management.state_validators import StateValidator
-
     missing_requirements = StateValidator.get_missing_requirements(state, current_phase)
 
     # Check agent triggers
-    available_agents = []
-    for agent_name in WorkflowTriggers.AGENT_TRIGGERS.keys():
-        if WorkflowTriggers.can_trigger_agent(agent_name, state):
-            available_agents.append(agent_name)
+    available_agents = WorkflowTriggers.batch_triggerable(state)
 
     return {
         "current_phase": current_phase.value,
@@ -198,42 +237,3 @@ def validate_workflow_state(tool_context: ToolContext) -> Dict[str, Any]:
         "workflow_complete": current_phase == WorkflowPhase.DELIVERY,
         "validation_timestamp": time.time(),
     }
-    """Tool for comprehensive workflow validation"""
-
-    def __init__(self):
-        super().__init__(
-            name="validate_workflow_state",
-            description="Comprehensive validation of current workflow state",
-        )
-
-    async def run(self, context: ToolContext) -> Dict[str, Any]:
-        """Validate entire workflow state"""
-        state = context.state
-        current_phase = WorkflowPhase(
-            state.get(StateKeys.CURRENT_PHASE, WorkflowPhase.DISCOVERY.value)
-        )
-
-        # Run quality gates
-        quality_results = QualityGateConfig.validate_phase(current_phase, state)
-
-        # Check state completeness
-        from tools.state_management.state_validators import StateValidator
-
-        missing_requirements = StateValidator.get_missing_requirements(
-            state, current_phase
-        )
-
-        # Check agent triggers
-        available_agents = []
-        for agent_name in WorkflowTriggers.AGENT_TRIGGERS.keys():
-            if WorkflowTriggers.can_trigger_agent(agent_name, state):
-                available_agents.append(agent_name)
-
-        return {
-            "current_phase": current_phase.value,
-            "quality_validation": quality_results,
-            "missing_requirements": missing_requirements,
-            "available_agents": available_agents,
-            "workflow_complete": current_phase == WorkflowPhase.DELIVERY,
-            "validation_timestamp": time.time(),
-        }